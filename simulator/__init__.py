@@ -1,3 +1,10 @@
-from .simulator import Simulator
-
 __version__ = '0.1'
+
+
+def __getattr__(name: str):
+    # Simulator pulls numpy and the database models, only import it when it is used
+    if name == 'Simulator':
+        from .simulator import Simulator
+        return Simulator
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,84 +1,190 @@
+from __future__ import annotations
+
+import gzip
+import io
 import os
+import pickle
+import shutil
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import BinaryIO, Union, TYPE_CHECKING
 
 from .cli import parse_args, init_simulator
 from .context import GlobalContext
-from .database import *
-from .logging import simulator_logger
-from .simulator import Simulator
-from .utils import cast
 
+if TYPE_CHECKING:
+    from .simulator import Simulator
+
+
+CHECKPOINT_COMPRESS_LEVEL = 1
+'''Gzip level of checkpoint files, most of its size are random states that barely compress.'''
+
+
+def sync_file(f: BinaryIO) -> None:
+    f.flush()
+    os.fsync(f.fileno())
 
-def dump_session(
-        path: Path,
-        global_vars: Dict[str, Any]
+    # Checkpoint is only read back on the next run, don't let it push the simulation out of page cache
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def dump_simulator(
+        file: Union[Path, BinaryIO],
+        simulator: Simulator
     ) -> None:
-    import dill
+    if isinstance(file, Path):
+        with open(file, 'wb', buffering=1 << 20) as f:
+            with gzip.GzipFile(fileobj=f, mode='wb', compresslevel=CHECKPOINT_COMPRESS_LEVEL) as gz:
+                dump_simulator(gz, simulator)
+
+            sync_file(f)
+        return
+
+    # Only fallback to dill for object that couldn't be handled by the standard pickle
+    try:
+        data = pickle.dumps(simulator, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        import dill
 
-    for var, value in global_vars.items():
-        globals()[var] = value
+        data = dill.dumps(simulator, protocol=pickle.HIGHEST_PROTOCOL)
 
-    global_vars_to_ignore = set(
-        var
-        for var in globals().keys()
-        if not var.startswith('__')
-            and var not in global_vars.keys()
+    file.write(data)
+
+
+def load_simulator(path: Path) -> Simulator:
+    from .simulator import Simulator
+
+    if GlobalContext.POSTGRES_DB_HOST is None:
+        database_hint = f"the SQLite database '{GlobalContext.SQLITE_DB_PATH}'"
+    else:
+        database_hint = f"the tables in Postgres database '{GlobalContext.POSTGRES_DB_NAME}'"
+
+    error_message = (
+        f"Failed to load checkpoint '{path}', it is either corrupted or saved by an older version of the simulator. "
+        f"Remove it and {database_hint}, then run 'init' again."
     )
-    ignored_dir = {
-        var: globals()[var]
-        for var in global_vars_to_ignore
-    }
-    for var in global_vars_to_ignore:
-        del globals()[var]
 
-    dill.dump_session(path)
+    with open(path, 'rb', buffering=1 << 20) as f:
+        # Checkpoints are always gzipped, anything else is a session dumped by an older version
+        if f.peek(2)[:2] != b'\x1f\x8b':
+            raise ValueError(error_message)
 
-    for var, value in ignored_dir.items():
-        globals()[var] = value
+        try:
+            with gzip.GzipFile(fileobj=f, mode='rb') as gz:
+                simulator = pickle.load(gz)
+        except (pickle.UnpicklingError, EOFError, OSError, ImportError, AttributeError, KeyError, ValueError) as exc:
+            raise ValueError(error_message) from exc
 
+    # Sessions dumped by older versions hold the whole __main__ module, not the simulator
+    if not isinstance(simulator, Simulator):
+        raise ValueError(error_message)
 
-def load_session(path: Path) -> None:
-    import dill
+    return simulator
 
-    dill.load_session(path)
+
+def replace_checkpoint(temp_checkpoint_path: Path) -> None:
+    # Atomically swap in the new checkpoint, so there is always a complete one on disk
+    os.replace(temp_checkpoint_path, GlobalContext.CHECKPOINT_SESSION_PATH)
+
+    try:
+        dir_fd = os.open(GlobalContext.CHECKPOINT_SESSION_PATH.parent, os.O_RDONLY)
+    except OSError:
+        # Directory couldn't be opened on some platform, e.g. Windows
+        return
+
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def write_checkpoint(
+        data: bytes,
+        temp_checkpoint_path: Path,
+        archive_checkpoint_path: Path,
+        keep: bool
+    ) -> None:
+    # Compressed in the writer thread, zlib releases the GIL while the simulation continues
+    data = gzip.compress(data, compresslevel=CHECKPOINT_COMPRESS_LEVEL)
+    with open(temp_checkpoint_path, 'wb') as f:
+        f.write(data)
+        sync_file(f)
+
+    replace_checkpoint(temp_checkpoint_path)
+
+    if keep:
+        # Checkpoint is never modified in place, only replaced, so archive can share its inode
+        try:
+            os.link(GlobalContext.CHECKPOINT_SESSION_PATH, archive_checkpoint_path)
+        except OSError:
+            shutil.copy2(GlobalContext.CHECKPOINT_SESSION_PATH, archive_checkpoint_path)
+
+
+def complete_checkpoint(
+        future: Future,
+        checkpoint_datetime: datetime
+    ) -> None:
+    from .database import VersionModel
+    from .logging import simulator_logger
+
+    future.result()
+
+    version_record = VersionModel.get()
+    version_record.modified_datetime = checkpoint_datetime
+    version_record.save()
+    simulator_logger.info(f"Checkpoint saved in '{GlobalContext.CHECKPOINT_SESSION_PATH}'.")
 
 
 if __name__ == '__main__':
     args = parse_args()
 
-    temp_checkpoint_path = (
-        GlobalContext.CHECKPOINT_SESSION_PATH.parent
-        / (GlobalContext.CHECKPOINT_SESSION_PATH.name + '.tmp')
+    # Heavy modules are only needed after the arguments are valid, keep them out of --help
+    from .database import (
+        EmployeeModel,
+        EmployeeShiftScheduleModel,
+        EmployeeAttendanceModel,
+        OrderModel,
+        OrderSKUModel,
+        StoreModel
     )
+    from .logging import simulator_logger
+    from .utils import cast
+
+    checkpoint_dir = GlobalContext.CHECKPOINT_SESSION_PATH.parent
+    checkpoint_stem = GlobalContext.CHECKPOINT_SESSION_PATH.name.partition('.pkl')[0]
+    temp_checkpoint_path = checkpoint_dir / (GlobalContext.CHECKPOINT_SESSION_PATH.name + '.tmp')
 
     command: str = args.command
     if command == 'init':
-        _time = datetime.now()
+        _time = time.perf_counter()
         simulator: Simulator = init_simulator(
             seed=args.seed,
             rewrite=args.rewrite
         )
         simulator_logger.info(
             f"Succesfully generate the simulator. "
-            f'{(datetime.now() - _time).total_seconds():.1f}s'
+            f'{time.perf_counter() - _time:.1f}s'
         )
 
-        _time = datetime.now()
+        _time = time.perf_counter()
         simulator_logger.info(f"Dumping simulator checkpoint at '{simulator.current_datetime()}' simulation time.")
-        dump_session(temp_checkpoint_path, { 'simulator': simulator })
-        os.rename(temp_checkpoint_path, GlobalContext.CHECKPOINT_SESSION_PATH)
+        dump_simulator(temp_checkpoint_path, simulator)
+        replace_checkpoint(temp_checkpoint_path)
         simulator_logger.info(
             f"Checkpoint saved in '{GlobalContext.CHECKPOINT_SESSION_PATH}'. "
-            f'{(datetime.now() - _time).total_seconds():.1f}s'
+            f'{time.perf_counter() - _time:.1f}s'
         )
 
     elif command == 'run':
         simulator_logger.info('Loading last checkpoint...')
-        load_session(GlobalContext.CHECKPOINT_SESSION_PATH)
-
-        simulator: Simulator = globals()['simulator']
+        try:
+            simulator = load_simulator(GlobalContext.CHECKPOINT_SESSION_PATH)
+        except ValueError as exc:
+            simulator_logger.error(str(exc))
+            raise SystemExit(1)
 
         # Adjust simulation speed and interval
         if args.speed is not None:
@@ -109,30 +215,45 @@ if __name__ == '__main__':
         max_datetime = cast(args.max_datetime, datetime) if args.max_datetime is not None else args.max_datetime
         skip_step = args.skip_step
         checkpoint_interval = args.checkpoint if args.checkpoint > 0 else None
-        while simulator.next_step() is not None:
-            simulator.run(sync, max_datetime, skip_step)
-
-            current_datetime = simulator.current_datetime()
-            simulator_logger.info(f"Dumping simulator checkpoint at '{current_datetime}' simulation time.")
-            dump_session(
-                temp_checkpoint_path,
-                { 'simulator': simulator }
-            )
-
-            old_checkpoint_path = (
-                GlobalContext.CHECKPOINT_SESSION_PATH.parent
-                / (
-                    GlobalContext.CHECKPOINT_SESSION_PATH.name.split('.pkl')[0]
-                    + f"_{simulator.current_step().isoformat(timespec='seconds')}.pkl"
+        # Checkpoint is serialized while the simulation is paused, but written in the background
+        checkpoint_executor = ThreadPoolExecutor(max_workers=1)
+        checkpoint_future: Union[Future, None] = None
+        checkpoint_datetime: Union[datetime, None] = None
+        next_datetime = simulator.next_step()
+        try:
+            # Stop once the run reaches the max datetime, instead of checkpointing the same step again
+            while next_datetime is not None \
+                    and (
+                        max_datetime is None
+                        or next_datetime <= max_datetime
+                    ):
+                simulator.run(sync, max_datetime, skip_step)
+
+                current_datetime = simulator.current_datetime()
+                simulator_logger.info(f"Dumping simulator checkpoint at '{current_datetime}' simulation time.")
+                checkpoint_buffer = io.BytesIO()
+                dump_simulator(checkpoint_buffer, simulator)
+
+                archive_checkpoint_path = (
+                    checkpoint_dir
+                    / f"{checkpoint_stem}_{simulator.current_step().isoformat(timespec='seconds')}.pkl"
+                )
+
+                if checkpoint_future is not None:
+                    complete_checkpoint(checkpoint_future, checkpoint_datetime)
+
+                checkpoint_future = checkpoint_executor.submit(
+                    write_checkpoint,
+                    checkpoint_buffer.getvalue(),
+                    temp_checkpoint_path,
+                    archive_checkpoint_path,
+                    args.keep
                 )
-            )
-            os.rename(GlobalContext.CHECKPOINT_SESSION_PATH, old_checkpoint_path)
+                checkpoint_datetime = current_datetime
+                next_datetime = simulator.next_step()
 
-            if not args.keep:
-                old_checkpoint_path.unlink()
+        finally:
+            if checkpoint_future is not None:
+                complete_checkpoint(checkpoint_future, checkpoint_datetime)
 
-            os.rename(temp_checkpoint_path, GlobalContext.CHECKPOINT_SESSION_PATH)
-            version_record = VersionModel.get()
-            version_record.modified_datetime = current_datetime
-            version_record.save()
-            simulator_logger.info(f"Checkpoint saved in '{GlobalContext.CHECKPOINT_SESSION_PATH}'.")
+            checkpoint_executor.shutdown()
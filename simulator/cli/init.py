@@ -1,8 +1,12 @@
+from __future__ import annotations
+
 import argparse
-from typing import Union
+from typing import Union, TYPE_CHECKING
 
 from ..context import GlobalContext
-from ..simulator import Simulator
+
+if TYPE_CHECKING:
+    from ..simulator import Simulator
 
 
 def add_init_parser(subparsers) -> None:
@@ -30,4 +34,6 @@ def init_simulator(
     if not rewrite and GlobalContext.CHECKPOINT_SESSION_PATH.exists():
         raise FileExistsError()
 
+    from ..simulator import Simulator
+
     return Simulator(seed=seed)
@@ -6,6 +6,12 @@ from typing import Any, List, Union
 
 from .utils import get_dict_value
 
+try:
+    # libyaml loader is much faster for the large location config
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
 DAYS_IN_YEAR = 365.2425
 
 
@@ -103,7 +109,7 @@ class GlobalContext:
 
         if cls.CONFIG_ITEM is None:
             with open(config_path) as f:
-                cls.CONFIG_ITEM = yaml.safe_load(f)
+                cls.CONFIG_ITEM = yaml.load(f, Loader=_YAMLLoader)
 
         return cls.CONFIG_ITEM
 
@@ -113,6 +119,6 @@ class GlobalContext:
 
         if cls.CONFIG_LOCATION is None:
             with open(config_path) as f:
-                cls.CONFIG_LOCATION = yaml.safe_load(f)
+                cls.CONFIG_LOCATION = yaml.load(f, Loader=_YAMLLoader)
 
         return cls.CONFIG_LOCATION
@@ -1,16 +1,33 @@
-import uuid
+from __future__ import annotations
+
+import operator
 from datetime import date, datetime, timedelta
 from typing import Any, Dict, List, Tuple, Union
 
 from ..utils import cast
 
-_STEP_TYPE = Union[int, datetime]
+_STEP_TYPE = Union[int, float, datetime]
 _INTERVAL_TYPE = Union[int, float, timedelta]
 
 
 class IdentityMixin:
+    _last_id: int = 0
+    '''Last id given in this process, ids only need to be unique within one simulator.'''
+
     def __init_id__(self) -> None:
-        self._id = int(uuid.uuid4())
+        IdentityMixin._last_id += 1
+        self._id = IdentityMixin._last_id
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        parent = super()
+        if hasattr(parent, '__setstate__'):
+            parent.__setstate__(state)
+        else:
+            self.__dict__.update(state)
+
+        # Keep ids of objects created after loading a checkpoint unique
+        if self._id > IdentityMixin._last_id:
+            IdentityMixin._last_id = self._id
 
     @property
     def id(self) -> int:
@@ -28,22 +45,34 @@ class RandomGeneratorMixin:
             size: int,
             maxlen: int = 6
         ) -> List[int]:
-        return [ int(num) for num in self._rng.random(size) * int('1' + '0' * maxlen) ]
+        return (self._rng.random(size) * 10 ** maxlen).astype(int).tolist()
 
 
 class ReprMixin:
     __repr_attrs__: Tuple[str]
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        repr_attrs = getattr(cls, '__repr_attrs__', ())
+        cls._repr_format = (
+            cls.__name__
+            + '('
+            + ', '.join([ f'{identifier}={{{i}}}' for i, identifier in enumerate(repr_attrs) ])
+            + ')'
+        )
+        cls._repr_getters = tuple(operator.attrgetter(identifier) for identifier in repr_attrs)
+
     def __repr__(self) -> str:
-        kwargs: Dict[str, str] = dict()
-        for identifier in self.__class__.__repr_attrs__:
-            attr = getattr(self, identifier)
+        values = []
+        for getter in self._repr_getters:
+            attr = getter(self)
             if callable(attr):
                 attr = attr()
 
-            kwargs[identifier] = attr
+            values.append(attr)
 
-        return f"{self.__class__.__name__}({', '.join([f'{k}={v}' for k, v in kwargs.items()])})"
+        return self._repr_format.format(*values)
 
 
 class StepMixin:
@@ -109,6 +138,12 @@ class StepMixin:
     def next_step(self) -> _STEP_TYPE:
         return self._next_step
 
+    def __getstate__(self) -> Dict[str, Any]:
+        return self.__dict__.copy()
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+
     def step(self, *args, **kwargs) -> Tuple[_STEP_TYPE, Union[_STEP_TYPE, None]]:
         self._step_count += 1
         current_step = self.next_step()
@@ -302,7 +337,7 @@ class RandomDatetimeStepMixin(DatetimeStepMixin, RandomGeneratorMixin):
             interval: Tuple[_INTERVAL_TYPE, Tuple[_INTERVAL_TYPE, _INTERVAL_TYPE]],
             max_step: datetime = None,
         ) -> None:
-        self._interval_min, self._interval_max = self._normalize_interval_range(interval)
+        self.interval = interval
 
         super().__init_step__(
             initial_step,
@@ -352,6 +387,8 @@ class RandomDatetimeStepMixin(DatetimeStepMixin, RandomGeneratorMixin):
             value: Tuple[_INTERVAL_TYPE, Tuple[_INTERVAL_TYPE, _INTERVAL_TYPE]]
         ) -> None:
         self._interval_min, self._interval_max = self._normalize_interval_range(value)
+        self._interval_min_seconds = self._interval_min.total_seconds()
+        self._interval_max_seconds = self._interval_max.total_seconds()
 
     @property
     def interval_min(self) -> timedelta:
@@ -363,7 +400,7 @@ class RandomDatetimeStepMixin(DatetimeStepMixin, RandomGeneratorMixin):
 
     def random_interval(self) -> timedelta:
         interval = self._rng.uniform(
-            self._interval_min.total_seconds(),
-            self._interval_max.total_seconds()
+            self._interval_min_seconds,
+            self._interval_max_seconds
         )
         return timedelta(seconds=interval)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import abc
-from typing import List, Iterable, Tuple, Union, TYPE_CHECKING
+import heapq
+from typing import Any, Dict, List, Iterable, Tuple, Union, TYPE_CHECKING
 
 from ._base import IdentityMixin, RandomGeneratorMixin, ReprMixin, StepMixin, _STEP_TYPE, _INTERVAL_TYPE
 
@@ -29,7 +30,7 @@ class Agent(IdentityMixin, StepMixin, RandomGeneratorMixin, ReprMixin, metaclass
             raise IndexError()
 
         for agent in self.parent.agents():
-            if agent != self:
+            if agent is not self:
                 yield agent
 
     def get_next_step(self, current_step: _STEP_TYPE) -> Union[_STEP_TYPE, None]:
@@ -53,15 +54,45 @@ class Agent(IdentityMixin, StepMixin, RandomGeneratorMixin, ReprMixin, metaclass
         return current_step, next_step
 
 
+def _due_indices(
+        steps: List[Union[_STEP_TYPE, None]],
+        max_step: _STEP_TYPE
+    ) -> List[int]:
+    due_indices = []
+    for index, step in enumerate(steps):
+        if step is not None \
+                and step <= max_step:
+            due_indices.append(index)
+
+    return due_indices
+
+
 class MultiAgentStepMixin(StepMixin):
+    __state_version__ = 1
+    '''Version of the pickled agents layout, bumped whenever `__getstate__` changes it.'''
+
     def __init_agents__(
             self,
             agents: Iterable[Agent] = None,
             skip_step: bool = False
         ) -> None:
-        self._agents: List[Agent] = agents if agents is not None else []
+        self._agents: List[Agent] = list(agents) if agents is not None else []
+        self._agent_indices: Dict[int, int] = {
+            agent.id: index
+            for index, agent in enumerate(self._agents)
+        }
+        self._agent_next_steps: List[Union[_STEP_TYPE, None]] = [
+            agent.next_step()
+            for agent in self._agents
+        ]
+        '''Next step of each agent, aligned with `_agents`. It is refreshed whenever the agent is stepped by this multi agent.'''
         self._skip_step = skip_step
 
+        self._agent_step_queue: List[Tuple[_STEP_TYPE, int]] = []
+        '''Min-heap of agents' next step and id, only maintained while skipping step. Outdated entries are dropped lazily.'''
+        if self._skip_step:
+            self._rebuild_agent_step_queue()
+
         self._rc = False
         '''Whether step is in racing condition, where agent step is increase while this multi agent hasn't.'''
 
@@ -71,6 +102,11 @@ class MultiAgentStepMixin(StepMixin):
 
     @skip_step.setter
     def skip_step(self, value: bool) -> bool:
+        if value and not self._skip_step:
+            self._rebuild_agent_step_queue()
+        elif not value:
+            self._agent_step_queue = []
+
         self._skip_step = value
         for agent in self.agents():
             if isinstance(agent, MultiAgentStepMixin):
@@ -85,10 +121,17 @@ class MultiAgentStepMixin(StepMixin):
             yield agent
 
     def add_agent(self, agent: Agent) -> None:
-        if agent in self._agents:
+        if agent.id in self._agent_indices:
             raise IndexError(f"Agent is already in the index.")
 
+        self._agent_indices[agent.id] = len(self._agents)
         self._agents.append(agent)
+        agent_next_step = agent.next_step()
+        self._agent_next_steps.append(agent_next_step)
+        if self._skip_step \
+                and agent_next_step is not None:
+            heapq.heappush(self._agent_step_queue, ( agent_next_step, agent.id ))
+
         agent.parent = self
         if isinstance(agent, MultiAgentStepMixin):
             agent.skip_step = self.skip_step
@@ -98,12 +141,87 @@ class MultiAgentStepMixin(StepMixin):
             self.add_agent(agent)
 
     def remove_agent(self, agent: Agent) -> None:
-        self._agents.remove(agent)
+        index = self._agent_indices.pop(agent.id)
+
+        # Fill the gap with the last agent, agent order is not meaningful
+        last_agent = self._agents.pop()
+        last_agent_next_step = self._agent_next_steps.pop()
+        if last_agent is not agent:
+            self._agents[index] = last_agent
+            self._agent_next_steps[index] = last_agent_next_step
+            self._agent_indices[last_agent.id] = index
 
     def remove_agents(self, agents: Iterable[Agent]) -> None:
         for agent in agents:
             self.remove_agent(agent)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+
+        # Index and queue are derived from agent ids, which are stored in the agents order
+        del state['_agent_step_queue']
+        state['_agent_indices'] = [ agent.id for agent in self._agents ]
+        state['_state_version'] = self.__state_version__
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        state_version = state.pop('_state_version', None)
+        if state_version != self.__state_version__:
+            raise ValueError(
+                f"Unsupported pickled state version {state_version!r} of '{self.__class__.__name__}', "
+                f'expected {self.__state_version__!r}.'
+            )
+
+        agent_ids: List[int] = state.pop('_agent_indices')
+        super().__setstate__(state)
+
+        self._agent_indices = {
+            agent_id: index
+            for index, agent_id in enumerate(agent_ids)
+        }
+        self._agent_step_queue = []
+        if self._skip_step:
+            self._rebuild_agent_step_queue(agent_ids)
+
+    def _rebuild_agent_step_queue(self, agent_ids: List[int] = None) -> None:
+        if agent_ids is None:
+            agent_ids = [ agent.id for agent in self._agents ]
+
+        self._agent_step_queue = [
+            ( agent_next_step, agent_id )
+            for agent_id, agent_next_step in zip(agent_ids, self._agent_next_steps)
+            if agent_next_step is not None
+        ]
+        heapq.heapify(self._agent_step_queue)
+
+    def _min_agent_next_step(self) -> Union[_STEP_TYPE, None]:
+        queue = self._agent_step_queue
+        while len(queue) > 0:
+            agent_next_step, agent_id = queue[0]
+            index = self._agent_indices.get(agent_id)
+            if index is not None \
+                    and self._agent_next_steps[index] == agent_next_step:
+                return agent_next_step
+
+            heapq.heappop(queue)
+
+    def _pop_due_agent_indices(self, max_step: _STEP_TYPE) -> List[int]:
+        queue = self._agent_step_queue
+        agent_indices = self._agent_indices
+        agent_next_steps = self._agent_next_steps
+
+        due_indices = set()
+        while len(queue) > 0 \
+                and queue[0][0] <= max_step:
+            agent_next_step, agent_id = heapq.heappop(queue)
+            index = agent_indices.get(agent_id)
+            if index is not None \
+                    and agent_next_steps[index] == agent_next_step:
+                due_indices.add(index)
+
+        # Keep the same agents order as the full scan
+        return sorted(due_indices)
+
     def current_step(self) -> _STEP_TYPE:
         return super().current_step() if not self._rc else super().next_step()
 
@@ -120,13 +238,7 @@ class MultiAgentStepMixin(StepMixin):
                 or next_step is None:
             return next_step
 
-        min_agent_next_step = None
-        for agent in self.agents():
-            agent_next_step = agent.next_step()
-            if min_agent_next_step is None \
-                or agent_next_step < min_agent_next_step:
-                min_agent_next_step = agent_next_step
-
+        min_agent_next_step = self._min_agent_next_step()
         if min_agent_next_step is None \
                 or min_agent_next_step > next_step:
             return min_agent_next_step
@@ -138,11 +250,22 @@ class MultiAgentStepMixin(StepMixin):
 
         _, next_step = super().step(*args, **kwargs)
         if next_step is not None:
-            for agent in self.agents():
-                agent_next_step = agent.next_step()
-                if agent_next_step is not None \
-                        and agent_next_step <= next_step:
-                    agent.step()
+            agents = self._agents
+            agent_next_steps = self._agent_next_steps
+            if self._skip_step:
+                queue = self._agent_step_queue
+                due_indices = self._pop_due_agent_indices(next_step)
+            else:
+                queue = None
+                due_indices = _due_indices(agent_next_steps, next_step)
+
+            for index in due_indices:
+                agent = agents[index]
+                _, agent_next_step = agent.step()
+                agent_next_steps[index] = agent_next_step
+                if queue is not None \
+                        and agent_next_step is not None:
+                    heapq.heappush(queue, ( agent_next_step, agent.id ))
 
         self._rc = False
         return super().step(*args, **kwargs)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import abc
 import time
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
 from typing import Iterable, Tuple, Union
 
@@ -51,24 +52,26 @@ class Environment(BaseEnvironment):
         super().__init__(
             initial_step=cast(initial_step, type_),
             interval=cast(interval, type_),
-            max_step=cast(max_step, type_),
+            max_step=cast(max_step, type_) if max_step is not None else max_step,
             skip_step=False,
             agents=agents,
-            sed=seed
+            seed=seed
         )
 
     def step(self) -> Tuple[int, Union[int, None]]:
         return super().step()
 
     def run(self, interval: int = None, *args, **kwargs) -> None:
-        start_step = self.current_step()
+        max_step = self.current_step() + interval if interval is not None else None
+
+        step = self.step
         next_step = self.next_step()
         while next_step is not None \
                 and (
-                    interval is None
-                    or next_step - start_step <= interval
+                    max_step is None
+                    or next_step <= max_step
                 ):
-            _, next_step = self.step(*args, **kwargs)
+            _, next_step = step(*args, **kwargs)
 
 
 class DatetimeEnvironment(BaseEnvironment, DatetimeStepMixin, ReprMixin):
@@ -125,8 +128,13 @@ class DatetimeEnvironment(BaseEnvironment, DatetimeStepMixin, ReprMixin):
             *args,
             **kwargs
         ) -> Tuple[datetime, Union[datetime, None]]:
-        real_start_datetime = datetime.now()
+        if not sync:
+            return self.step(*args, **kwargs)
+
+        real_start_time = time.monotonic()
         current_datetime, next_datetime = self.step(*args, **kwargs)
+        if next_datetime is None:
+            return current_datetime, next_datetime
 
         real_current_datetime = datetime.now()
         speed_adjusted_real_current_datetime = real_current_datetime
@@ -135,9 +143,8 @@ class DatetimeEnvironment(BaseEnvironment, DatetimeStepMixin, ReprMixin):
                 self._real_initial_datetime
                 + self.speed * (real_current_datetime - self._real_initial_datetime)
             )
-        if sync and next_datetime is not None \
-                and next_datetime > speed_adjusted_real_current_datetime:
-            elapsed_seconds = (real_current_datetime - real_start_datetime).total_seconds()
+        if next_datetime > speed_adjusted_real_current_datetime:
+            elapsed_seconds = time.monotonic() - real_start_time
             await_seconds = self.step_delay - elapsed_seconds
             if await_seconds > 0:
                 time.sleep(await_seconds)
@@ -156,13 +163,15 @@ class DatetimeEnvironment(BaseEnvironment, DatetimeStepMixin, ReprMixin):
             _skip_step = self.skip_step
             self.skip_step = skip_step
 
+        # Pick the step once, instead of checking sync on every step
+        step = partial(self.step_await, True) if sync else self.step
         next_step = self.next_step()
         while next_step is not None \
                 and (
                     max_datetime is None
                     or max_datetime >= next_step
                 ):
-            _, next_step = self.step_await(sync=sync, *args, **kwargs)
+            _, next_step = step(*args, **kwargs)
 
         if skip_step is not None:
             self.skip_step = _skip_step
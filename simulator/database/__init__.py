@@ -1,5 +1,5 @@
 from datetime import datetime
-from peewee import Database, IntegrityError
+from peewee import Database, IntegrityError, OperationalError, ProgrammingError
 from typing import List
 
 from ..context import GlobalContext
@@ -33,17 +33,21 @@ def create_database(created_datetime: datetime = None) -> Database:
         created_datetime = datetime.now()
 
     database: Database = BaseModel._meta.database
-    database.create_tables(MODELS)
-
-    _populate_payment_method(created_datetime)
-    _populate_items(created_datetime)
-    _populate_locations(created_datetime)
+    # Populate in one transaction instead of committing every record. Records which might be
+    # duplicated are created in a nested savepoint, so the failure doesn't abort the transaction.
+    with database.atomic():
+        database.create_tables(MODELS)
+
+        _populate_payment_method(created_datetime)
+        _populate_items(created_datetime, database)
+        _populate_locations(created_datetime, database)
+
+        database.create_tables([ VersionModel ])
+        VersionModel.create(
+            created_datetime=created_datetime,
+            modified_datetime=created_datetime
+        )
 
-    database.create_tables([ VersionModel ])
-    VersionModel.create(
-        created_datetime=created_datetime,
-        modified_datetime=created_datetime
-    )
     return database
 
 
@@ -56,16 +60,17 @@ def _populate_payment_method(created_datetime: datetime) -> None:
         )
 
 
-def _populate_items(created_datetime: datetime) -> None:
+def _populate_items(created_datetime: datetime, database: Database) -> None:
     import numpy as np
 
     item_config = GlobalContext.get_config_item()
     for category in item_config['categories']:
         try:
-            category_record = CategoryModel.create(
-                name=category['name'],
-                created_datetime=created_datetime
-            )
+            with database.atomic():
+                category_record = CategoryModel.create(
+                    name=category['name'],
+                    created_datetime=created_datetime
+                )
         except IntegrityError:
             category_record = (
                 CategoryModel.select()
@@ -75,11 +80,12 @@ def _populate_items(created_datetime: datetime) -> None:
 
         for product in category['products']:
             try:
-                product_record = ProductModel.create(
-                    name=product['name'],
-                    category=category_record.id,
-                    created_datetime=created_datetime
-                )
+                with database.atomic():
+                    product_record = ProductModel.create(
+                        name=product['name'],
+                        category=category_record.id,
+                        created_datetime=created_datetime
+                    )
             except IntegrityError:
                 product_record = (
                     ProductModel.select()
@@ -89,29 +95,31 @@ def _populate_items(created_datetime: datetime) -> None:
 
             for sku in product['skus']:
                 try:
-                    SKUModel.create(
-                        name=sku['name'],
-                        brand=sku['brand'],
-                        price=np.ceil(sku['price'] * GlobalContext.CURRENCY_MULTIPLIER / 100) * 100,
-                        cost=sku['cost'] * GlobalContext.CURRENCY_MULTIPLIER,
-                        product=product_record.id,
-                        created_datetime=created_datetime,
-                        modified_datetime=created_datetime
-                    )
+                    with database.atomic():
+                        SKUModel.create(
+                            name=sku['name'],
+                            brand=sku['brand'],
+                            price=np.ceil(sku['price'] * GlobalContext.CURRENCY_MULTIPLIER / 100) * 100,
+                            cost=sku['cost'] * GlobalContext.CURRENCY_MULTIPLIER,
+                            product=product_record.id,
+                            created_datetime=created_datetime,
+                            modified_datetime=created_datetime
+                        )
                 except IntegrityError:
                     continue
 
 
-def _populate_locations(created_datetime: datetime) -> None:
+def _populate_locations(created_datetime: datetime, database: Database) -> None:
     location_config = GlobalContext.get_config_location()
     for country in location_config['countries']:
         try:
-            country_record = CountryModel.create(
-                code=country['id'],
-                name=country['name'],
-                created_datetime=created_datetime,
-                modified_datetime=created_datetime
-            )
+            with database.atomic():
+                country_record = CountryModel.create(
+                    code=country['id'],
+                    name=country['name'],
+                    created_datetime=created_datetime,
+                    modified_datetime=created_datetime
+                )
         except IntegrityError:
             country_record = (
                 CountryModel.select()
@@ -121,13 +129,14 @@ def _populate_locations(created_datetime: datetime) -> None:
 
         for province in country['provinces']:
             try:
-                province_record = ProvinceModel.create(
-                    code=province['id'],
-                    name=province['name'],
-                    country=country_record.id,
-                    created_datetime=created_datetime,
-                    modified_datetime=created_datetime
-                )
+                with database.atomic():
+                    province_record = ProvinceModel.create(
+                        code=province['id'],
+                        name=province['name'],
+                        country=country_record.id,
+                        created_datetime=created_datetime,
+                        modified_datetime=created_datetime
+                    )
             except IntegrityError:
                 province_record = (
                     ProvinceModel.select()
@@ -137,13 +146,14 @@ def _populate_locations(created_datetime: datetime) -> None:
 
             for city in province['cities']:
                 try:
-                    city_record = CityModel.create(
-                        code=city['id'],
-                        name=city['name'],
-                        province=province_record.id,
-                        created_datetime=created_datetime,
-                        modified_datetime=created_datetime
-                    )
+                    with database.atomic():
+                        city_record = CityModel.create(
+                            code=city['id'],
+                            name=city['name'],
+                            province=province_record.id,
+                            created_datetime=created_datetime,
+                            modified_datetime=created_datetime
+                        )
                 except IntegrityError:
                     city_record = (
                         CityModel.select()
@@ -153,13 +163,14 @@ def _populate_locations(created_datetime: datetime) -> None:
 
                 for district in city['districts']:
                     try:
-                        district_record = DistrictModel.create(
-                            code=district['id'],
-                            name=district['name'],
-                            city=city_record.id,
-                            created_datetime=created_datetime,
-                            modified_datetime=created_datetime
-                        )
+                        with database.atomic():
+                            district_record = DistrictModel.create(
+                                code=district['id'],
+                                name=district['name'],
+                                city=city_record.id,
+                                created_datetime=created_datetime,
+                                modified_datetime=created_datetime
+                            )
                     except IntegrityError:
                         district_record = (
                             DistrictModel.select()
@@ -169,12 +180,13 @@ def _populate_locations(created_datetime: datetime) -> None:
 
                     for subdistrict in district['subdistricts']:
                         try:
-                            SubdistrictModel.create(
-                                code=subdistrict['id'],
-                                name=subdistrict['name'],
-                                district=district_record.id,
-                                created_datetime=created_datetime,
-                                modified_datetime=created_datetime
-                            )
+                            with database.atomic():
+                                SubdistrictModel.create(
+                                    code=subdistrict['id'],
+                                    name=subdistrict['name'],
+                                    district=district_record.id,
+                                    created_datetime=created_datetime,
+                                    modified_datetime=created_datetime
+                                )
                         except IntegrityError:
                             continue
@@ -1,12 +1,19 @@
 import logging
 from datetime import datetime
+from functools import lru_cache
 from logging import NOTSET, INFO, DEBUG, WARNING, ERROR
 
 from .context import GlobalContext
 
 
+@lru_cache(maxsize=1)
+def _format_sim_time(dt: datetime) -> str:
+    # Logs of a step share the same simulation time, so only the last one is kept
+    return dt.isoformat(sep=' ', timespec='seconds')
+
+
 def simulator_log_format(*args, dt: datetime, sep=' '):
-    return f"[SIM-TIME {dt.isoformat(sep=' ', timespec='seconds')}] {sep.join([ str(arg) for arg in args ])}"
+    return f"[SIM-TIME {_format_sim_time(dt)}] {sep.join(map(str, args))}"
 
 
 def get_logger(
@@ -248,7 +248,7 @@ class Place(ModelMixin, ReprMixin):
                 seeds
             ):
             subdistrict: SubdistrictModel = (
-                SubdistrictModel.select()
+                SubdistrictModel.select(SubdistrictModel.code, SubdistrictModel.name)
                 .limit(1)
                 .offset(int(subdistrict_id))
                 .execute()
@@ -1,11 +1,12 @@
 import numpy as np
+import time
 from datetime import datetime, timedelta
 from typing import Iterable, List, Tuple
 
 from .core import RandomDatetimeEnvironment
 from .context import GlobalContext, DAYS_IN_YEAR
-from .database import Database, StoreModel, create_database
-from .logging import simulator_logger, simulator_log_format
+from .database import Database, OperationalError, ProgrammingError, StoreModel, create_database
+from .logging import DEBUG, INFO, simulator_logger, simulator_log_format
 from .population import Place
 from .store import Store
 
@@ -52,20 +53,24 @@ class Simulator(RandomDatetimeEnvironment):
 
         self.store_growth_rate = store_growth_rate if store_growth_rate is not None else GlobalContext.STORE_GROWTH_RATE
 
-        # Create simulator database if not available
-        if StoreModel.table_exists() \
-                and StoreModel.select().count() > 1:
+        # Create simulator database if not available, missing table means there is no database yet
+        try:
+            n_store_records = StoreModel.select().count()
+        except ( OperationalError, ProgrammingError ):
+            n_store_records = 0
+
+        if n_store_records > 1:
             raise FileExistsError('Database is already exists.')
 
         else:
-            _time = datetime.now()
+            _time = time.perf_counter()
             database: Database = StoreModel._meta.database
             simulator_logger.info(f"Preparing {database.__class__.__name__.split('Database')[0]} database for the simulator...")
             create_database(initial_datetime)
-            simulator_logger.info(f'Simulator database is ready. {(datetime.now() - _time).total_seconds():.1f}s')
+            simulator_logger.info(f'Simulator database is ready. {time.perf_counter() - _time:.1f}s')
 
         # Generate stores
-        _time = datetime.now()
+        _time = time.perf_counter()
         simulator_logger.info('Generating stores...')
         for store in self.generate_stores(
                 initial_stores if initial_stores is not None else GlobalContext.INITIAL_STORES,
@@ -74,8 +79,9 @@ class Simulator(RandomDatetimeEnvironment):
                 GlobalContext.INITIAL_STORES_RANGE_DAYS
             ):
             self.add_agent(store)
-            simulator_logger.debug(f"New store '{store.place_name}' with market population size {store.total_market_population()} has been added. It will be built on '{store.initial_date}'.")
-        simulator_logger.info(f'Generated {self.n_stores} stores. {(datetime.now() - _time).total_seconds():.1f}s')
+            if simulator_logger.isEnabledFor(DEBUG):
+                simulator_logger.debug(f"New store '{store.place_name}' with market population size {store.total_market_population()} has been added. It will be built on '{store.initial_date}'.")
+        simulator_logger.info(f'Generated {self.n_stores} stores. {time.perf_counter() - _time:.1f}s')
 
         simulator_logger.info(f'Simulator has been created. Total market population: {self.total_market_population()}.')
 
@@ -86,6 +92,9 @@ class Simulator(RandomDatetimeEnvironment):
     def stores(self) -> Iterable[Store]:
         return super().agents()
 
+    def n_active_stores(self, current_datetime: datetime) -> int:
+        return sum(1 for store in self.stores() if store.initial_datetime <= current_datetime)
+
     def total_market_population(self) -> int:
         return sum([ store.total_market_population() for store in self.stores() ])
 
@@ -124,8 +133,9 @@ class Simulator(RandomDatetimeEnvironment):
         past_datetime = self.current_datetime()
         current_datetime, next_datetime = super().step()
 
+        # Summaries below are only for logging, don't compute them if nobody reads it
+        log_info = simulator_logger.isEnabledFor(INFO)
         n_stores = self.n_stores
-        n_active_stores = len([ store for store in self.stores() if store.initial_datetime <= current_datetime ])
 
         # @ 1 day - Daily update possibility of store growth
         if current_datetime.day != past_datetime.day:
@@ -137,7 +147,7 @@ class Simulator(RandomDatetimeEnvironment):
                     new_store = self.generate_stores(1, GlobalContext.STORE_MARKET_POPULATION, current_datetime)[0]
                     self.add_agent(new_store)
                     simulator_logger.info(simulator_log_format(
-                        f"New store '{store.place_name}' has been built with market population size {new_store.total_market_population()}.",
+                        f"New store '{new_store.place_name}' has been built with market population size {new_store.total_market_population()}.",
                         dt=current_datetime
                     ))
 
@@ -146,9 +156,10 @@ class Simulator(RandomDatetimeEnvironment):
                     simulator_logger.error(f'Failed to build new store.', exc_info=True)
 
         # @ 1 month - Log market population size monthly
-        if current_datetime.month != past_datetime.month:
+        if current_datetime.month != past_datetime.month \
+                and log_info:
             simulator_logger.info(simulator_log_format(
-                f'Total active stores: {n_active_stores}/{n_stores}.',
+                f'Total active stores: {self.n_active_stores(current_datetime)}/{n_stores}.',
                 f'Total market population: {self.total_market_population()}.',
                 dt=current_datetime
             ))
@@ -160,7 +171,8 @@ class Simulator(RandomDatetimeEnvironment):
 
         # @ 15 mins - Log synchronization between simulation and the real/projected datetime
         if current_datetime.minute % 15 == 0 \
-                and current_datetime.minute != past_datetime.minute:
+                and current_datetime.minute != past_datetime.minute \
+                and log_info:
             real_current_datetime = datetime.now()
             speed_adjusted_real_current_datetime = real_current_datetime
             if self.speed != 1.0:
@@ -179,10 +191,11 @@ class Simulator(RandomDatetimeEnvironment):
                 ))
 
         # @ 1 hour - Log today orders hourly
-        if current_datetime.hour != past_datetime.hour:
+        if current_datetime.hour != past_datetime.hour \
+                and log_info:
             simulator_logger.info(simulator_log_format(
-                f'Total active stores: {n_active_stores}/{n_stores}.',
-                f'Today cumulative orders: {sum([ store.total_orders for store in self.stores() ])}.',
+                f'Total active stores: {self.n_active_stores(current_datetime)}/{n_stores}.',
+                f'Today cumulative orders: {sum(store.total_orders for store in self.stores())}.',
                 dt=current_datetime
             ))
 
@@ -31,10 +31,10 @@ def random_payment_method_config(
         for payment_method, weight in payment_method_weight.items()
     }
     payment_method_time: Dict[PaymentMethod, float] = {
-        PaymentMethod.CASH: np.clip(rng.normal(5.0, 1.0), 2.0, 15.0),
-        PaymentMethod.CREDIT_CARD: np.clip(rng.normal(15.0, 3.0), 10.0, 45.0),
-        PaymentMethod.DEBIT_CARD: np.clip(rng.normal(20.0, 3.0), 10.0, 45.0),
-        PaymentMethod.DIGITAL_CASH: np.clip(rng.normal(10.0, 2.0), 5.0, 30.0),
+        PaymentMethod.CASH: float(np.clip(rng.normal(5.0, 1.0), 2.0, 15.0)),
+        PaymentMethod.CREDIT_CARD: float(np.clip(rng.normal(15.0, 3.0), 10.0, 45.0)),
+        PaymentMethod.DEBIT_CARD: float(np.clip(rng.normal(20.0, 3.0), 10.0, 45.0)),
+        PaymentMethod.DIGITAL_CASH: float(np.clip(rng.normal(10.0, 2.0), 5.0, 30.0)),
     }
     return payment_method_prob, payment_method_time
 
@@ -254,13 +254,13 @@ class Customer(Agent, DatetimeStepMixin):
             )
             + np.sum(
                 np.clip(
-                    self._rng.normal(2.5, size=sum([quantity - 1 for _, quantity in order.order_skus()])),
+                    self._rng.normal(2.5, size=order.n_items - order.n_order_skus),
                     0.0,
                     5.0
                 )
             )
         )
-        return collection_time
+        return float(collection_time)
 
     def calculate_payment_time(self, order: Order) -> float:
         payment_time = self.payment_method_time[order.payment_method]
@@ -10,7 +10,7 @@ from ..enums import (
     AgeGroup, Gender, FamilyStatus, OrderStatus,
     EmployeeAttendanceStatus, EmployeeShift, EmployeeStatus
 )
-from ..logging import store_logger
+from ..logging import DEBUG, store_logger
 from ..population import Person, Place
 from .order import Order
 
@@ -90,13 +90,14 @@ class Employee(Agent, ModelMixin):
             if current_datetime.hour == 0:
                 raise
 
-            store_logger.debug(
-                f'{current_datetime.isoformat()}'
-                f' - STORE {self.parent.place_name}'
-                f' - EMPLOYEE BEGIN SHIFT'
-                f'- {self.name}[{self.record_id}].'
-                f' Would end shift at {self.schedule_shift_end_datetime.isoformat()}.'
-            )
+            if store_logger.isEnabledFor(DEBUG):
+                store_logger.debug(
+                    f'{current_datetime.isoformat()}'
+                    f' - STORE {self.parent.place_name}'
+                    f' - EMPLOYEE BEGIN SHIFT'
+                    f'- {self.name}[{self.record_id}].'
+                    f' Would end shift at {self.schedule_shift_end_datetime.isoformat()}.'
+                )
             self.begin_shift(current_datetime)
 
         # Assign to be cashier, if there's an idle cashier machine
@@ -109,12 +110,13 @@ class Employee(Agent, ModelMixin):
                 and self.today_shift_end_datetime is None \
                 and self.schedule_shift_end_datetime <= current_datetime \
                 and (self.parent.n_cashiers + self.parent.total_active_shift_employees() - 1) > 0:
-            store_logger.debug(
-                f'{current_datetime.isoformat()}'
-                f' - STORE {self.parent.place_name}'
-                f' - EMPLOYEE COMPLETE SHIFT'
-                f'- {self.name}[{self.record_id}].'
-            )
+            if store_logger.isEnabledFor(DEBUG):
+                store_logger.debug(
+                    f'{current_datetime.isoformat()}'
+                    f' - STORE {self.parent.place_name}'
+                    f' - EMPLOYEE COMPLETE SHIFT'
+                    f'- {self.name}[{self.record_id}].'
+                )
             self.complete_shift(current_datetime)
 
             self._next_step = (
@@ -232,13 +234,13 @@ class Employee(Agent, ModelMixin):
             )
             + np.sum(
                 np.clip(
-                    self._rng.normal(1.0, 0.25, size=sum([quantity - 1 for _, quantity in order.order_skus()])),
+                    self._rng.normal(1.0, 0.25, size=order.n_items - order.n_order_skus),
                     0.0,
                     5.0
                 )
             )
         )
-        return checkout_time
+        return float(checkout_time)
 
     def estimate_age_group(self, person: Person, current_date: date) -> AgeGroup:
         age = person.age(current_date) + self._rng.normal(0, (6.0 - self.age_recognition_rate) * 2)
@@ -277,38 +279,38 @@ class Employee(Agent, ModelMixin):
         if rng is None:
             rng = np.random.RandomState(seed)
 
-        age_recognition_rate = np.clip(
+        age_recognition_rate = float(np.clip(
             rng.normal(
                 age_recognition_loc,
                 age_recognition_scale
             ),
             1.0,
             5.0
-        )
-        counting_skill_rate = np.clip(
+        ))
+        counting_skill_rate = float(np.clip(
             rng.normal(
                 counting_skill_loc,
                 counting_skill_scale
             ),
             1.0,
             5.0
-        )
-        content_rate = np.clip(
+        ))
+        content_rate = float(np.clip(
             rng.normal(
                 content_rate_loc,
                 content_rate_scale
             ),
             1.0,
             5.0
-        )
-        discipline_rate = np.clip(
+        ))
+        discipline_rate = float(np.clip(
             rng.normal(
                 discipline_rate_loc,
                 discipline_rate_scale
             ),
             1.0,
             5.0
-        )
+        ))
 
         gender = Gender.MALE if rng.random() < 0.5 else Gender.FEMALE
         age = np.clip(
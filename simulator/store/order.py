@@ -24,6 +24,7 @@ class Order(ReprMixin):
             current_datetime: datetime
         ) -> None:
         self._order_skus = order_skus
+        self._n_items = sum(quantity for _, quantity in order_skus)
         self.buyer = buyer
         self.payment_method: PaymentMethod = None
 
@@ -44,6 +45,10 @@ class Order(ReprMixin):
     def n_order_skus(self) -> int:
         return len(self._order_skus)
 
+    @property
+    def n_items(self) -> int:
+        return self._n_items
+
     def order_skus(self) -> Iterable[List[Tuple[SKU, int]]]:
         for sku, quantity in self._order_skus:
             yield sku, quantity
@@ -1,25 +1,28 @@
 from datetime import date, datetime, timedelta
-from typing import Any, List
+from typing import Any, Callable, Dict, List, Tuple
+
+_CAST_FUNCTIONS: Dict[Tuple[type, type], Callable[[Any], Any]] = {
+    (str, bool): lambda value: value.lower() == 'true',
+    (str, date): date.fromisoformat,
+    (str, datetime): datetime.fromisoformat,
+    (datetime, date): datetime.date,
+    (int, timedelta): lambda value: timedelta(seconds=value),
+    (float, timedelta): lambda value: timedelta(seconds=value)
+}
+'''Conversion functions by (value type, target type), looked up before the generic casting.'''
 
 
 def cast(_value: Any, _type: type) -> Any:
-    if isinstance(_value, _type):
+    value_type = type(_value)
+    if value_type is _type:
         return _value
 
-    elif _type is bool:
-        return _value.lower() == 'true' if isinstance(_value, str) else bool(_value)
-
-    elif _type is date \
-            and isinstance(_value, str):
-        return date.fromisoformat(_value)
+    cast_function = _CAST_FUNCTIONS.get((value_type, _type))
+    if cast_function is not None:
+        return cast_function(_value)
 
-    elif _type is date \
-            and isinstance(_value, datetime):
-        return _value.date()
-
-    elif _type is datetime \
-            and isinstance(_value, str):
-        return datetime.fromisoformat(_value)
+    if isinstance(_value, _type):
+        return _value
 
     elif _type is timedelta \
             and (isinstance(_value, int) or isinstance(_value, float)):